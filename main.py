@@ -3,41 +3,33 @@ from tkinter import simpledialog
 from dataclasses import dataclass
 from math import cos, sin, pi
 from typing import Optional
-from collections import defaultdict
-from itertools import combinations
+from collections import Counter
+from itertools import combinations, combinations_with_replacement, starmap
+from functools import lru_cache
 import random
 
-# -=x=- Player Classes -=x=- (We sync them up when we need the UI to update states)
+# -=x=- Player Classes -=x=- (The UI draws straight from these, there's no separate UI copy to sync)
 
 # This is the class for the game logic 
 
-@dataclass
+@dataclass(slots=True)
 class GamePlayer:
     name: str
     stack: int
     bet: int = 0
-    made_decision_this_round: bool = False
     in_hand: bool = True
     cards_hidden: bool = True  # hole cards not shown
-    cards: tuple[str, str] = ("??", "??")
-    last_action: Optional[str] = None # "check", "call", "raise", "fold"
-    show_hand_box: bool = False
-
-# This is the class for the UI
-
-@dataclass
-class UIPlayer:
-    name: str
-    stack: int
-    bet: int = 0
-    in_hand: bool = True
-    cards_hidden: bool = True  # hole cards not shown
-    cards: tuple[str, str] = ("??", "??")
+    cards: tuple[int, int] = (0, 0) # packed cards (see make_card), 0 until dealt
     last_action: Optional[str] = None # "check", "call", "raise", "fold"
     show_hand_box: bool = False
+    strength: Optional[int] = None # cached best hand strength (see evaluate_five)
+    strength_stage: int = -1 # number of board cards the cached strength was computed with
 
 RANKS = "23456789TJQKA"
 SUITS = "cdhs"  # clubs, diamonds, hearts, spades
+RANK_IDX = {rank: i + 2 for i, rank in enumerate(RANKS)}  # "2" -> 2, ..., "A" -> 14
+CARD_STRS = tuple(RANKS[i % 13] + SUITS[i // 13] for i in range(52))  # card ID -> "Ah", the same 52 strings every hand
+PARSED_CARD = {card: (RANK_IDX[card[0]], card[1]) for card in CARD_STRS}  # "Ah" -> (14, "h")
 HAND_TYPE_NAME = {
     0: "High Card",
     1: "One Pair",
@@ -59,9 +51,7 @@ def card_to_str(card_id: int) -> str:
     OUTPUTS:
         - a string such as "Ah" representing the card
     """
-    rank = RANKS[card_id % 13]
-    suit = SUITS[card_id // 13]
-    return f"{rank}{suit}"  # like "Ah", "7d", etc
+    return CARD_STRS[card_id]  # like "Ah", "7d", etc
 
 def parse_cards(cards: list[str]) -> list[tuple[int,str]]:
         """
@@ -73,12 +63,7 @@ def parse_cards(cards: list[str]) -> list[tuple[int,str]]:
         OUTPUTS:
             returns a list of tuples of the form (RANK IDX, "{SUIT}")
         """
-        new_list = []
-        for card in cards:
-            rank = RANKS.index(card[0]) + 2
-            suit = card[1]
-            new_list.append((rank, suit))
-        return new_list
+        return [PARSED_CARD[card] for card in cards]
 
 def score_five(cards: list[tuple[int,str]]) -> tuple[int, tuple]:
     """
@@ -106,100 +91,78 @@ def score_five(cards: list[tuple[int,str]]) -> tuple[int, tuple]:
         return
     ranks = sorted((r for r, _ in cards), reverse=True)
     pairs = get_pairs(ranks)
-    suits = [s for _, s in cards]
-    flush = len(set(suits)) == 1
-    straight = straight_high(ranks) # None if no straight exists
-    four_o_a_k = four_of_a_kind(pairs)
-    full_h = full_house(pairs)
-    three_o_a_k = three_of_a_kind(pairs)
-    two_p = two_pair(pairs)
-    one_p = one_pair(pairs)
 
-    # Royal flush
-    if straight == 14 and flush == True:
-        return (9, ())
+    # Hands are split by how many ranks repeat, so only the checks that can still match are run
+
+    # Five different ranks: the only case where a straight or flush is possible
+    if not pairs:
+        flush = len({s for _, s in cards}) == 1
+        straight = straight_high(ranks) # None if no straight exists
+
+        # Royal flush
+        if straight == 14 and flush == True:
+            return (9, ())
+
+        # Straight flush
+        if straight != None and flush == True:
+            return (8, (straight,))
+
+        # Flush
+        if flush == True:
+            return (5, tuple(ranks))
+
+        # Straight
+        if straight != None:
+            return (4, (straight,))
 
-    # Straight flush
-    elif straight != None and flush == True:
-        return (8, (straight,))
+        # High card
+        return (0, tuple(ranks))
 
-    # Quads
-    elif four_o_a_k != None:
-        rank_and_kickers = [four_o_a_k] + [rank for rank in ranks if rank != four_o_a_k]
-        return (7, tuple(rank_and_kickers))
+    # One repeated rank: quads, triples or one pair, followed by the kickers
+    if len(pairs) == 1:
+        rank, count = pairs[0]
+        rank_and_kickers = (rank, *(r for r in ranks if r != rank))
+        if count == 4:
+            return (7, rank_and_kickers)
+        if count == 3:
+            return (3, rank_and_kickers)
+        return (1, rank_and_kickers)
 
-    # Full house
-    elif full_h != None:
+    # Two repeated ranks: full house or two pair
+    full_h = full_house(pairs)
+    if full_h != None:
         return (6, (full_h[0], full_h[1]))
 
-    # Flush
-    elif flush == True:
-        return (5, tuple(ranks))
-
-    # Straight
-    elif straight != None:
-        return (4, (straight,))
-
-    # Triples
-    elif three_o_a_k != None:
-        ranks_and_kickers = [three_o_a_k] + [rank for rank in ranks if rank != three_o_a_k]
-        return (3, tuple(ranks_and_kickers))
-
-    # Two pair
-    elif two_p != None:
-        highp, lowp = two_p
-        kicker = max(r for r in ranks if r != highp and r != lowp)
-        return (2, (highp, lowp, kicker))
-
-    # One pair
-    elif one_p != None:
-        ranks_and_kickers = [one_p] + [rank for rank in ranks if rank != one_p]
-        return (1, tuple(ranks_and_kickers))
-    
-    # High card
-    return (0, tuple(ranks))
+    highp, lowp = two_pair(pairs)
+    kicker = max(r for r in ranks if r != highp and r != lowp)
+    return (2, (highp, lowp, kicker))
 
 def straight_high(ranks: list[int]) -> int | None:
     """
     Returns the top rank of the straight if one exists,
     otherwise None
+    ranks must be 5 different ranks sorted high to low (score_five only asks when nothing is paired)
     """
-    ranks = sorted(set(ranks), reverse=True)
-
-    if len(ranks) != 5:
-        return None
-    
     # Normal straight
     if ranks[0] - ranks[4] == 4:
         return ranks[0]
 
     # Handle A, 5, 4, 3, 2
-    if ranks == [14, 5, 4, 3, 2]:
+    if ranks[0] == 14 and ranks[1] == 5:
         return 5
 
     return None
 
-def four_of_a_kind(rank_counts: tuple[int]) -> int | None:
-    if len(rank_counts) != 1:
-        return None
-    if rank_counts[0][1] == 4:
-        return rank_counts[0][0]
-    return None
-
 def full_house(rank_counts: tuple[int]) -> tuple[int] | None:
-    rank_counts = sorted(rank_counts, key=lambda x: x[1], reverse=True)
     if len(rank_counts) != 2:
         return None
-    if rank_counts[0][1] == 3 and rank_counts[1][1] == 2:
-        ranks = tuple(sorted([rank[0] for rank in rank_counts], reverse=True))
-        return ranks
-    return None
-
-def three_of_a_kind(rank_counts: tuple[int]) -> int | None:
-    if len(rank_counts) != 1:
-        return None
-    if rank_counts[0][1] == 3:
-        return rank_counts[0][0]
+    # rank_counts is ordered by rank, so the trips can be either entry
+    (r0, c0), (r1, c1) = rank_counts
+    # (trips rank, pair rank), so 3s full of 2s beats 2s full of 3s
+    if c0 == 3 and c1 == 2:
+        return (r0, r1)
+    if c0 == 2 and c1 == 3:
+        return (r1, r0)
     return None
 
 def two_pair(rank_counts: tuple[int]) -> tuple[int] | None:
@@ -209,25 +172,122 @@ def two_pair(rank_counts: tuple[int]) -> tuple[int] | None:
         return (rank_counts[0][0], rank_counts[1][0])
     return None
 
-def one_pair(rank_counts: tuple[int]) -> int | None:
-    if len(rank_counts) != 1:
-        return None
-    if rank_counts[0][1] == 2:
-        return rank_counts[0][0]
-    return None
-
 def get_pairs(ranks: list[int]) -> tuple[int] | None:
-    rank_counts = defaultdict(int)
-    pairs = []
-    for rank in ranks:
-        rank_counts[rank] += 1
-    rank_counts = [(rank, count) for rank, count in rank_counts.items() if count != 1]
-    rank_counts = sorted(rank_counts, key=lambda x: x[0], reverse=True)
-    return rank_counts
-    
+    # Counter keeps first-seen order, and ranks come in sorted high to low, so no re-sort is needed
+    return [(rank, count) for rank, count in Counter(ranks).items() if count != 1]
+
+# -=x=- Fast Evaluator -=x=- (Cactus Kev style: cards are packed ints, hands are table lookups)
+
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)  # one per rank, 2 through A
+
+def make_card(rank_idx: int, suit_idx: int) -> int:
+    """
+    This function packs a card into Cactus Kev's 32-bit card format:
+        xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+        b = one bit for the rank, cdhs = one bit for the suit, r = rank index, p = rank prime
+    INPUTS:
+        - rank_idx is the index of the rank in RANKS (0 for "2" through 12 for "A")
+        - suit_idx is the index of the suit in SUITS
+    OUTPUTS:
+        - the packed card
+    """
+    return (1 << (16 + rank_idx)) | (0x8000 >> suit_idx) | (rank_idx << 8) | PRIMES[rank_idx]
+
+CARD_INT = {f"{r}{s}": make_card(ri, si) for si, s in enumerate(SUITS) for ri, r in enumerate(RANKS)}
+PACKED_CARD = tuple(CARD_INT[card] for card in CARD_STRS)  # deck card ID (0-51) -> packed card
+PACKED_STR = {packed: card for card, packed in CARD_INT.items()}  # packed card -> "Ah", for display only
+PACKED_STR[0] = "??"  # no real card packs to 0, it marks a card that hasn't been dealt
+
+def _build_hand_tables():
+    """
+    This function builds the lookup tables used by evaluate_five
+    Every distinct 5-card hand class (7462 of them) is scored once with score_five
+    and the classes are then numbered by strength, from 1 (7-5-4-3-2 high) to 7462 (royal flush)
+    OUTPUTS:
+        - flushes: rank bits -> strength, for flushes and straight flushes
+        - unique5: rank bits -> strength, for 5 different ranks without a flush (0 if not applicable)
+        - products: product of rank primes -> strength, for hands with a paired rank
+        - hand_types: strength -> hand type (see HAND_TYPE_NAME)
+    """
+    classes = []  # (score, table, key)
+    for rank_idxs in combinations_with_replacement(range(13), 5):
+        if max(rank_idxs.count(r) for r in rank_idxs) > 4:
+            continue
+        if len(set(rank_idxs)) == 5:
+            bits = 0
+            for r in rank_idxs:
+                bits |= 1 << r
+            suited = [(r + 2, "s") for r in rank_idxs]
+            offsuit = [(rank_idxs[0] + 2, "h")] + suited[1:]
+            classes.append((score_five(suited), "flushes", bits))
+            classes.append((score_five(offsuit), "unique5", bits))
+        else:
+            product = 1
+            for r in rank_idxs:
+                product *= PRIMES[r]
+            # Repeated ranks get different suits, so there's never a flush
+            cards = [(r + 2, SUITS[rank_idxs[:k].count(r)]) for k, r in enumerate(rank_idxs)]
+            classes.append((score_five(cards), "products", product))
+
+    classes.sort()
+    tables = {"flushes": [0] * 0x1F01, "unique5": [0] * 0x1F01, "products": {}}
+    hand_types = [None]
+    for strength, (score, table, key) in enumerate(classes, start=1):
+        tables[table][key] = strength
+        hand_types.append(score[0])
+    return tables["flushes"], tables["unique5"], tables["products"], hand_types
+
+FLUSH_TABLE, UNIQUE5_TABLE, PRODUCT_TABLE, STRENGTH_HAND_TYPE = _build_hand_tables()
+
+def evaluate_five(c1: int, c2: int, c3: int, c4: int, c5: int) -> int:
+    """
+    This function scores five packed cards (see make_card) with at most three table lookups
+    INPUTS:
+        - five packed cards
+    OUTPUTS:
+        - the hand's strength, from 1 (7-5-4-3-2 high) to 7462 (royal flush). Higher is better,
+        and two hands tie exactly when score_five would give them the same score
+    """
+    q = (c1 | c2 | c3 | c4 | c5) >> 16
+    # Flush: every card shares the suit bit
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return FLUSH_TABLE[q]
+    # Five different ranks: straight or high card
+    strength = UNIQUE5_TABLE[q]
+    if strength:
+        return strength
+    # Paired ranks: the product of the rank primes identifies the ranks
+    return PRODUCT_TABLE[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+
+def best_packed_strength(packed: list[int]) -> int:
+    """
+    This function finds the strength of the best 5-card hand out of 5 to 7 packed cards (see make_card)
+    """
+    # starmap drives the loop over the (up to 21) combinations from C, no generator frame per hand
+    return max(starmap(evaluate_five, combinations(packed, 5)))
+
+
+# -=x=- Game -=x=-
+
+def next_seat_in(mask: int, start_idx: int, n_seats: int) -> int:
+    """
+    This function finds the first seat at or after start_idx (wrapping around the table) whose bit is set in mask
+    INPUTS:
+        - mask is a seat bitmask with bit i set for seat i (such as PokerHand.active_mask)
+        - start_idx is the seat to start looking from
+        - n_seats is the number of seats at the table
+    OUTPUTS:
+        - the seat index, or -1 if no bit is set
+    """
+    if not mask:
+        return -1
+    # Two copies of the mask back to back, shifted so bit 0 is start_idx,
+    # then the lowest set bit is the distance to the seat we want
+    rotated = (mask | (mask << n_seats)) >> start_idx
+    return (start_idx + (rotated & -rotated).bit_length() - 1) % n_seats
 
 class PokerHand:
-    def __init__(self, players: list[GamePlayer], button_pos: int, big_blind: int):
+    def __init__(self, players: list[GamePlayer], button_pos: int, big_blind: int, deck: list[int] | None = None):
 
         self.players = players
         self.n_seats = len(players)
@@ -252,11 +312,22 @@ class PokerHand:
         self.players[self.bb_pos].name = f"Seat {self.bb_pos + 1} (BB)"
 
         self.pot = 0
-        self.board: list[str] = []  # will grow to 5
+        self.board: list[int] = []  # packed cards (see make_card), will grow to 5
+
+        # Running state so betting_round_complete() and advance_to_next_in_hand() don't rescan every seat,
+        # kept up to date by reset_players_for_hand, post_blinds, apply_action and start_new_betting_round.
+        # The masks have bit i set for seat i
+        self.active_mask = 0 # players still in the hand
+        self.todo_mask = 0 # players still in the hand who haven't acted since the last raise
+        self.bet_counts: dict[int, int] = {} # street bet -> number of players still in the hand at that bet
 
-        # Fresh, shuffled deck for this hand
-        self.deck = list(range(52))
-        random.shuffle(self.deck)
+        self.dirty_seats: set[int] = set() # seats changed by apply_action since the UI last drew them
+
+        # Shuffled deck for this hand. The game passes in the same 52-card list every hand and it's
+        # shuffled in place, cards are dealt with a cursor (from the end, like pop()) instead of removed
+        self.deck = deck if deck is not None else list(range(52))
+        self.shuffle_deck(2 * self.n_seats + 5) # hole cards + board
+        self.deck_idx = len(self.deck)
 
         self.reset_players_for_hand()
         self.post_blinds()
@@ -281,41 +352,51 @@ class PokerHand:
 
         action = action.lower()
 
+        seat_bit = 1 << seat_idx
+        self.dirty_seats.add(seat_idx)
+
+        # Read once into locals, the branches below only write back what changed
+        current_bet = self.current_bet
+        stack = p.stack
+        bet = p.bet
+
         if action == "fold":
+            self.active_mask &= ~seat_bit
+            self.todo_mask &= ~seat_bit
+            self._remove_bet(bet)
             p.in_hand = False
-            p.made_decision_this_round = True
             p.last_action = "FOLD"
 
         elif action == "check":
-            # check if already matched, otherwise it's a call
-            needed = max(0, self.current_bet - p.bet)
-            pay = min(needed, p.stack)
-            p.stack -= pay
-            p.bet += pay
+            # check if already matched, otherwise it's a call (all-in for less if the stack is short)
+            needed = current_bet - bet
+            pay = needed if 0 < needed <= stack else (stack if needed > 0 else 0)
+            p.stack = stack - pay
+            self._set_bet(p, bet + pay)
             self.pot += pay
-            p.made_decision_this_round = True
+            self.todo_mask &= ~seat_bit
 
-            p.last_action = "CHECK" if needed == 0 else "CALL"
+            p.last_action = "CHECK" if needed <= 0 else "CALL"
 
         elif action == "raise":
             if raise_to is None:
                 return
-            raise_to = max(raise_to, self.current_bet)
-            needed = max(0, raise_to - p.bet)
-            pay = min(needed, p.stack)
-            p.stack -= pay
-            p.bet += pay
+            if raise_to < current_bet:
+                raise_to = current_bet
+            needed = raise_to - bet
+            pay = needed if 0 < needed <= stack else (stack if needed > 0 else 0)
+            bet += pay
+            p.stack = stack - pay
+            self._set_bet(p, bet)
             self.pot += pay
 
-            if p.bet > self.current_bet:
-                self.current_bet = p.bet
-                for other in self.players:
-                    if other.in_hand and other is not p:
-                        other.made_decision_this_round = False
-
-            p.made_decision_this_round = True
+            if bet > current_bet:
+                self.current_bet = bet
+                self.todo_mask = self.active_mask & ~seat_bit # everyone else still in has to act again
+            else:
+                self.todo_mask &= ~seat_bit
 
-            p.last_action = f"RAISE {p.bet}"
+            p.last_action = f"RAISE {bet}"
 
     def betting_round_complete(self) -> bool:
         """
@@ -333,14 +414,39 @@ class PokerHand:
             - True or False representing whether the 
             betting round is complete or not
         """
-        in_hand_players = [p for p in self.players if p.in_hand]
-        if len(in_hand_players) <= 1:
-            return True  # hand effectively over / no betting needed
+        if self.active_mask & (self.active_mask - 1) == 0:
+            return True  # at most one bit set: hand effectively over / no betting needed
 
-        all_acted = all(p.made_decision_this_round for p in in_hand_players)
-        bets_equal = len({p.bet for p in in_hand_players}) <= 1
+        all_acted = self.todo_mask == 0
+        bets_equal = len(self.bet_counts) <= 1
         return all_acted and bets_equal
 
+    def _set_bet(self, p: GamePlayer, bet: int):
+        """
+        This function changes the street bet of a player still in the hand, keeping bet_counts in sync
+        INPUTS:
+            - p is the GamePlayer whose bet changes
+            - bet is the player's new total bet for this street
+        OUTPUTS:
+            - none
+        """
+        self._remove_bet(p.bet)
+        self.bet_counts[bet] = self.bet_counts.get(bet, 0) + 1
+        p.bet = bet
+
+    def _remove_bet(self, bet: int):
+        """
+        This function removes one player at the given bet from bet_counts
+        INPUTS:
+            - bet is the street bet of the player being removed
+        OUTPUTS:
+            - none
+        """
+        if self.bet_counts[bet] == 1:
+            del self.bet_counts[bet]
+        else:
+            self.bet_counts[bet] -= 1
+
     def start_new_betting_round(self):
         """
         This functons starts a new betting round by
@@ -358,10 +464,12 @@ class PokerHand:
         # so for UI cleanliness, reset displayed street bets to 0.
         for p in self.players:
             p.bet = 0
-            p.made_decision_this_round = False
             p.last_action = None
 
         self.current_bet = 0  # no one has bet yet this street
+        self.todo_mask = self.active_mask
+        n_in_hand = self.active_mask.bit_count()
+        self.bet_counts = {0: n_in_hand} if n_in_hand else {}
 
     def advance_to_next_in_hand(self):
         """
@@ -372,10 +480,9 @@ class PokerHand:
         OUTPUTS:
             - none
         """
-        for _ in range(self.n_seats):
-            self.current_player_idx = (self.current_player_idx + 1) % self.n_seats
-            if self.players[self.current_player_idx].in_hand:
-                return
+        idx = next_seat_in(self.active_mask, (self.current_player_idx + 1) % self.n_seats, self.n_seats)
+        if idx >= 0:
+            self.current_player_idx = idx
 
     def reset_players_for_hand(self):
         """
@@ -388,11 +495,16 @@ class PokerHand:
         for idx, p in enumerate(self.players):
             p.bet = 0
             p.in_hand = True
-            p.made_decision_this_round = False
-            p.cards = ("??", "??")
+            p.cards = (0, 0)
             p.last_action = None
             p.cards_hidden = (idx != 0)
             p.show_hand_box = (idx == 0)
+            p.strength = None
+            p.strength_stage = -1
+
+        self.active_mask = (1 << self.n_seats) - 1
+        self.todo_mask = self.active_mask
+        self.bet_counts = {0: self.n_seats}
 
     def post_blinds(self):
         """
@@ -405,14 +517,14 @@ class PokerHand:
         sb_p = self.players[self.sb_pos]
         bb_p = self.players[self.bb_pos]
 
-        sb = min(self.sb_amount, sb_p.stack)
-        bb = min(self.bb_amount, bb_p.stack)
+        sb = self.sb_amount if self.sb_amount <= sb_p.stack else sb_p.stack
+        bb = self.bb_amount if self.bb_amount <= bb_p.stack else bb_p.stack
 
         sb_p.stack -= sb
         bb_p.stack -= bb
 
-        sb_p.bet += sb
-        bb_p.bet += bb
+        self._set_bet(sb_p, sb_p.bet + sb)
+        self._set_bet(bb_p, bb_p.bet + bb)
 
         self.pot += sb + bb
 
@@ -424,10 +536,52 @@ class PokerHand:
         OUTPUTS:
             - none
         """
-        for i in range(self.n_seats):
-            c1 = card_to_str(self.deck.pop())
-            c2 = card_to_str(self.deck.pop())
-            self.players[i].cards = (c1, c2)
+        hole = self.draw_cards(2 * self.n_seats)
+        for p, c1, c2 in zip(self.players, hole[0::2], hole[1::2]):
+            p.cards = (PACKED_CARD[c1], PACKED_CARD[c2])
+
+    def shuffle_deck(self, n_cards: int):
+        """
+        This function shuffles only the cards that will be dealt this hand onto the top (end) of the deck.
+        It's a Fisher-Yates shuffle stopped after n_cards swaps, so those cards are just as random as
+        with a full shuffle, but a full table only needs 21 swaps instead of 51
+        INPUTS:
+            - n_cards is the number of cards that will be dealt
+        OUTPUTS:
+            - none
+        """
+        deck = self.deck
+        randrange = random.randrange
+        top = len(deck) - 1
+        for i in range(top, max(top - n_cards, 0), -1):
+            j = randrange(i + 1)
+            deck[i], deck[j] = deck[j], deck[i]
+
+    def draw_card(self) -> int:
+        """
+        This function takes the top card off the deck
+        INPUTS:
+            - none
+        OUTPUTS:
+            - the card ID (an integer between [0, 51])
+        """
+        if self.deck_idx < 1:
+            raise IndexError("no cards left in the deck")
+        self.deck_idx -= 1
+        return self.deck[self.deck_idx]
+
+    def draw_cards(self, n: int) -> list[int]:
+        """
+        This function takes the top n cards off the deck in one slice
+        INPUTS:
+            - n is the number of cards to take
+        OUTPUTS:
+            - a list of n card IDs
+        """
+        if self.deck_idx < n:
+            raise IndexError(f"can't draw {n} cards, only {self.deck_idx} left in the deck")
+        self.deck_idx -= n
+        return self.deck[self.deck_idx:self.deck_idx + n]
 
     def deal_flop(self):
         """
@@ -437,8 +591,8 @@ class PokerHand:
         OUTPUTS:
             - none
         """
-        # optional burn: self.deck.pop()
-        self.board = [card_to_str(self.deck.pop()) for _ in range(3)]
+        # optional burn: self.draw_card()
+        self.board = [PACKED_CARD[c] for c in self.draw_cards(3)]
 
     def deal_turn(self):
         """
@@ -448,8 +602,8 @@ class PokerHand:
         OUTPUTS:
             - none
         """
-        # optional burn: self.deck.pop()
-        self.board.append(card_to_str(self.deck.pop()))
+        # optional burn: self.draw_card()
+        self.board.append(PACKED_CARD[self.draw_card()])
 
     def deal_river(self):
         """
@@ -459,8 +613,8 @@ class PokerHand:
         OUTPUTS:
             - none
         """
-        # optional burn: self.deck.pop()
-        self.board.append(card_to_str(self.deck.pop()))
+        # optional burn: self.draw_card()
+        self.board.append(PACKED_CARD[self.draw_card()])
 
     def initiate_showdown(self):
         """
@@ -486,24 +640,14 @@ class PokerHand:
 
     def best_score_for_player(self, seat_idx: int):
         """
-        Best 5-card score from player's 2 hole cards + current board.
+        Best 5-card strength (see evaluate_five) from player's 2 hole cards + current board.
+        Cached on the player until the next street is dealt, since the UI asks on every redraw.
         """
         p = self.players[seat_idx]
-        cards7 = list(p.cards) + list(self.board)
-
-        if len(cards7) < 5 or "??" in cards7:
-            return None
-
-        parsed7 = parse_cards(cards7)
-
-        best = None
-        for combo in combinations(parsed7, 5):
-            sc = score_five(list(combo))   # should return (type, tuple) or None
-            if sc is None:
-                continue
-            if best is None or sc > best:
-                best = sc
-        return best
+        if p.strength_stage != len(self.board):
+            p.strength = best_packed_strength([*p.cards, *self.board]) if self.board else None
+            p.strength_stage = len(self.board)
+        return p.strength
 
     def winning_seats(self) -> list[int]:
         """
@@ -531,7 +675,7 @@ class PokerGame:
         self.n_seats = n_seats
         self.big_blind_amount = big_blind_amount
 
-        self.players = [GamePlayer(name="Seat 1 (Me)", stack=1500, show_hand_box=True)]
+        self.players = [GamePlayer(name="Seat 1 (Me)", stack=1500, cards_hidden=False, show_hand_box=True)]
         self.players += [GamePlayer(name=f"Seat {i+1}", stack=1500) for i in range(1, n_seats)]
 
         self.hand_number = 0
@@ -541,6 +685,7 @@ class PokerGame:
         #self.current_player_idx = self.button_pos
 
         self.hand: Optional[PokerHand] = None
+        self.deck = list(range(52))  # reused and reshuffled by every hand
 
     def start_hand(self):
         """
@@ -550,7 +695,7 @@ class PokerGame:
         OUTPUTS:
             - none
         """
-        self.hand = PokerHand(self.players, self.button_pos, self.big_blind_amount)
+        self.hand = PokerHand(self.players, self.button_pos, self.big_blind_amount, self.deck)
         self.hand_number += 1
 
     def end_hand(self):
@@ -570,11 +715,194 @@ class PokerGame:
         self.button_pos = (self.button_pos + 1) % self.n_seats
 
         # start a brand new hand object
-        self.hand = PokerHand(self.players, self.button_pos, self.big_blind_amount)
+        self.hand = PokerHand(self.players, self.button_pos, self.big_blind_amount, self.deck)
         self.hand_number += 1
 
 
+# -=x=- UI Geometry -=x=-
+
+@lru_cache(maxsize=None)
+def unit_circle(n_seats: int) -> tuple[tuple[float, float], ...]:
+    """
+    This function computes the (cos, sin) of every seat's angle around the table.
+    The angles only depend on the number of seats, so the trig is done once per n_seats
+    INPUTS:
+        - n_seats is the number of seats at the table
+    OUTPUTS:
+        - a tuple of (cos(a), sin(a)) for each seat, starting at bottom center
+    """
+    # Put one seat at bottom center like most poker UIs
+    start_angle = pi/2
+    angles = (start_angle + i * 2*pi/n_seats for i in range(n_seats))
+    return tuple((cos(a), sin(a)) for a in angles)
+
+@lru_cache(maxsize=8)
+def seat_positions(cx: float, cy: float, rx: float, ry: float, n_seats: int) -> tuple[tuple[float, float], ...]:
+    """
+    Returns (x,y) points around an ellipse.
+    Cached, so redraws with an unchanged window size do no work here
+    """
+    return tuple((cx + rx * c, cy + ry * s) for c, s in unit_circle(n_seats))
+
+
 # -=x=- UI -=x=-
+
+# Fonts are shared so Tk doesn't have to parse a new font description for every item
+FONT_POT = ("Helvetica", 18, "bold")
+FONT_NAME = ("Helvetica", 12, "bold")
+FONT_STACK = ("Helvetica", 11)
+FONT_HAND = ("Helvetica", 10, "bold")
+FONT_CHECK = ("Helvetica", 7, "bold")
+FONT_CHIP = ("Helvetica", 9, "bold")
+
+# Card sizes (width, height) in pixels
+COMMUNITY_CARD_SIZE = (60, 84)
+HOLE_CARD_SIZE = (46, 64)
+
+@lru_cache(maxsize=8)
+def seat_layout(cx: float, cy: float, rx: float, ry: float, n_seats: int) -> tuple:
+    """
+    This function computes where every item of every seat goes, so a layout pass
+    only hands already-built coordinates to the canvas
+    INPUTS:
+        - cx, cy, rx, ry is the ellipse the seats sit on
+        - n_seats is the number of seats at the table
+    OUTPUTS:
+        - for each seat, a tuple of:
+            - ((item name, coords), ...) for the seat's items (see PokerGameUI.build_scene)
+            - the (x1, y1, w, h) bounds of the seat's two hole cards
+    """
+    layout = []
+    for sx, sy in seat_positions(cx, cy, rx, ry, n_seats):
+        # Seat box
+        box_w, box_h = 150, 60
+        x1, y1 = sx - box_w/2, sy - box_h/2
+        x2, y2 = sx + box_w/2, sy + box_h/2
+
+        # ---- Optional HAND box under seat box ----
+        hand_box_h = 24
+        gap = 6
+        hx1, hy1 = x1, y2 + gap
+        hx2, hy2 = x2, y2 + gap + hand_box_h
+
+        # --- Action/bet badge pinned to top-left of seat tag (outside the box) ---
+        badge_r = 14
+        badge_x = x1 + badge_r + 6
+        badge_y = y1 - badge_r - 6
+
+        item_coords = (
+            ("box", (x1, y1, x2, y2)),
+            ("name", (sx, sy-10)),
+            ("stack", (sx, sy+12)),
+            ("hand_box", (hx1, hy1, hx2, hy2)),
+            ("hand_text", (sx, (hy1 + hy2) / 2)),
+            ("badge", (badge_x - badge_r, badge_y - badge_r, badge_x + badge_r, badge_y + badge_r)),
+            ("badge_text", (badge_x, badge_y)),
+        )
+
+        # Hold cards near seat
+        hold_w, hold_h = HOLE_CARD_SIZE
+        cards_x, cards_y = sx, sy - 62
+        hole_bounds = tuple(
+            ((cards_x + (k - 0.5) * (hold_w * 0.55)) - hold_w/2, cards_y - hold_h/2, hold_w, hold_h)
+            for k in range(2)
+        )
+
+        layout.append((item_coords, hole_bounds))
+    return tuple(layout)
+
+def _in_rounded_rect(px: float, py: float, x1: float, y1: float, x2: float, y2: float, r: float, inset: float = 0) -> bool:
+    """Returns True if the point (px, py) is inside the rounded rectangle shrunk by inset pixels"""
+    x1, y1, x2, y2, r = x1 + inset, y1 + inset, x2 - inset, y2 - inset, max(0, r - inset)
+    if not (x1 <= px <= x2 and y1 <= py <= y2):
+        return False
+    dx = max(x1 + r - px, 0, px - (x2 - r))
+    dy = max(y1 + r - py, 0, py - (y2 - r))
+    return dx*dx + dy*dy <= r*r
+
+def card_back_image(master: tk.Misc, w: int, h: int) -> tk.PhotoImage:
+    """
+    This function paints the Bicycle-ish card back into an image. The UI keeps one per card size,
+    so every face-down card is a single canvas image instead of ~100 lines and polygons
+    INPUTS:
+        - master is the widget whose Tk interpreter owns the image
+        - w, h are the card's width and height in pixels
+    OUTPUTS:
+        - a PhotoImage of the card back (corners outside the card are transparent)
+    """
+    blue, white, border = "#0b2a6f", "#ffffff", "#111111"
+    px = [[None] * w for _ in range(h)]
+
+    # Outer card and inner border (same geometry as the old vector drawing)
+    pad = max(3, int(min(w, h) * 0.08))
+    for y in range(h):
+        for x in range(w):
+            cx, cy = x + 0.5, y + 0.5
+            if not _in_rounded_rect(cx, cy, 0, 0, w, h, 10):
+                continue
+            if not _in_rounded_rect(cx, cy, 0, 0, w, h, 10, inset=2):
+                px[y][x] = border
+            elif (_in_rounded_rect(cx, cy, pad - 1, pad - 1, w - pad + 1, h - pad + 1, 8)
+                  and not _in_rounded_rect(cx, cy, pad + 1, pad + 1, w - pad - 1, h - pad - 1, 6)):
+                px[y][x] = white
+            else:
+                px[y][x] = blue
+
+    # Pattern: tiny diagonal stitches, every other pixel like the "gray50" stipple
+    ix1, iy1, ix2, iy2 = pad, pad, w - pad, h - pad
+    step = max(6, int(min(w, h) * 0.12))
+    seg = max(6, step)  # segment length
+
+    def stitch(x0, y0, x1, y1):
+        n = int(max(abs(x1 - x0), abs(y1 - y0)))
+        for t in range(n + 1):
+            x = int(round(x0 + (x1 - x0) * t / max(n, 1)))
+            y = int(round(y0 + (y1 - y0) * t / max(n, 1)))
+            if (x + y) % 2 == 0 and 0 <= x < w and 0 <= y < h:
+                px[y][x] = white
+
+    y = iy1 + 2
+    while y < iy2 - 2:
+        x = ix1 + 2
+        while x < ix2 - 2:
+            stitch(x, y, min(x + seg, ix2 - 2), min(y + seg, iy2 - 2))  # down-right stitch
+            stitch(x, y, min(x + seg, ix2 - 2), max(y - seg, iy1 + 2))  # down-left stitch
+            x += step
+        y += step
+
+    # Center emblem: a ring with a star inside, over a plain blue disc
+    ecx, ecy, erx, ery = w / 2, h / 2, w * 0.15, h * 0.15
+    star_r = max(12, int(h*0.25)) * 0.4
+    star = [
+        (ecx + (star_r if k % 2 == 0 else star_r * 0.4) * cos(-pi/2 + k * pi/5),
+         ecy + (star_r if k % 2 == 0 else star_r * 0.4) * sin(-pi/2 + k * pi/5))
+        for k in range(10)
+    ]
+
+    def in_star(x, y):
+        inside = False
+        for (ax, ay), (bx, by) in zip(star, star[1:] + star[:1]):
+            if (ay > y) != (by > y) and x < ax + (y - ay) * (bx - ax) / (by - ay):
+                inside = not inside
+        return inside
+
+    for y in range(h):
+        for x in range(w):
+            d = ((x + 0.5 - ecx) / erx) ** 2 + ((y + 0.5 - ecy) / ery) ** 2
+            ring = (1 - 1.5 / min(erx, ery)) ** 2
+            if d <= ring:
+                px[y][x] = white if in_star(x + 0.5, y + 0.5) else blue
+            elif d <= 1:
+                px[y][x] = white
+
+    img = tk.PhotoImage(master=master, width=w, height=h)
+    img.put(" ".join("{" + " ".join(c or blue for c in row) + "}" for row in px), to=(0, 0))
+    for y, row in enumerate(px):
+        for x, c in enumerate(row):
+            if c is None:
+                img.transparency_set(x, y, True)
+    return img
+
 class PokerGameUI(tk.Tk):
     def __init__(self, n_seats=8):
         super().__init__()
@@ -585,26 +913,23 @@ class PokerGameUI(tk.Tk):
         self.paused = False
 
         self._next_hand_job = None
+        self._redraw_job = None
+        self._configured_size = (0, 0)
 
         self.n_seats = n_seats
 
         self.game = PokerGame(n_seats=self.n_seats, big_blind_amount=50)
 
-        self.players = [UIPlayer(name=f"Me (Seat 1)", stack=1500, bet=0, in_hand=True, cards_hidden=False, show_hand_box=True)]
-        self.players += [
-            UIPlayer(name=f"Seat {i+1}", stack=1500, bet=0, in_hand=True, cards_hidden=True)
-            for i in range(1, n_seats)
-        ]
-
         self.pot = 0
-        self.community = ["??"] * 5
+        self.community: list[str] = []  # board cards dealt so far, the rest are drawn face down
 
         # Canvas for all drawing
         self.canvas = tk.Canvas(self, bg="#1f1f1f", highlightthickness=0)
         self.canvas.pack(fill="both", expand=True)
+        self.build_scene()
 
         # Redraw on resize
-        self.canvas.bind("<Configure>", lambda e: self.redraw())
+        self.canvas.bind("<Configure>", self._on_configure)
 
         # Simple demo controls
         bar = tk.Frame(self, bg="#111")
@@ -655,8 +980,9 @@ class PokerGameUI(tk.Tk):
                 return  
 
             hand.start_new_betting_round()
-
-        self.sync_from_game()
+            self.sync_from_game() # new street, every seat's bet was cleared
+        else:
+            self.partial_sync() # only the seat that just acted (and the pot) changed
 
     def schedule_next_hand(self, delay_ms: int = 7000):
         # prevent double-scheduling if something calls it twice
@@ -674,9 +1000,27 @@ class PokerGameUI(tk.Tk):
         self.sync_from_game()
 
 
+    def _on_configure(self, event):
+        # <Configure> also fires when nothing about the size changed, ignore those
+        size = (event.width, event.height)
+        if size == self._configured_size:
+            return
+        self._configured_size = size
+
+        # A drag-resize fires many <Configure> events, restart a one-frame (~16ms) timer on each
+        # so the table is laid out once the size settles instead of for every event
+        if self._redraw_job is not None:
+            self.after_cancel(self._redraw_job)
+        self._redraw_job = self.after(16, self._flush_redraw)
+
+    def _flush_redraw(self):
+        self._redraw_job = None
+        self.redraw()
+
     def sync_from_game(self):
         """
-        This function syncs the player data between the UIPlayer objects and GamePlayer objects
+        This function syncs the pot and board from the current hand and redraws the table.
+        Seats are drawn straight from the game's GamePlayer objects, so they need no copying
         INPUTS:
             - none
         OUTPUTS:
@@ -687,43 +1031,30 @@ class PokerGameUI(tk.Tk):
             return
 
         self.pot = hand.pot
-        self.community = (hand.board + ["??"] * 5)[:5]
-
-        for i in range(self.n_seats):
-            gp = self.game.players[i]
-            up = self.players[i]
-
-            up.stack = gp.stack
-            up.bet = gp.bet
-            up.in_hand = gp.in_hand
-            up.cards = gp.cards
-            up.name = gp.name
-            up.cards_hidden = gp.cards_hidden
-            up.last_action = gp.last_action
-            up.show_hand_box = gp.show_hand_box
-
-            if self.game.hand.in_showdown == False:
-                # Only you see your cards
-                up.cards_hidden = (i != 0)
-
+        self.community = [PACKED_STR[card] for card in hand.board]
+        hand.dirty_seats.clear()
         self.redraw()
 
-    # -=x=- Helper Functions for UI (Don't Modify) -=x=-
-    def seat_positions(self, cx, cy, rx, ry):
+    def partial_sync(self):
         """
-        Returns list of (x,y,angle) points around an ellipse.
+        This function updates only the pot and the seats the current hand marked as changed,
+        for actions that don't change the board or anyone else's seat
+        INPUTS:
+            - none
+        OUTPUTS:
+            - none
         """
-        pts = []
-        # Put one seat at bottom center like most poker UIs
-        start_angle = pi/2
-        for i in range(self.n_seats):
-            a = start_angle + i * 2*pi/self.n_seats
-            x = cx + rx * cos(a)
-            y = cy + ry * sin(a)
-            pts.append((x, y, a))
-        return pts
+        hand = self.game.hand
+        if hand is None:
+            return
 
-    # -=x=- Drawing (Don't Modify) -=x=-
+        self.pot = hand.pot
+        self.update_pot()
+        for i in hand.dirty_seats:
+            self.update_seat(i)
+        hand.dirty_seats.clear()
+
+    # -=x=- Drawing -=x=-
 
     SUIT_SYMBOL = {"c": "♣", "d": "♦", "h": "♥", "s": "♠"}
     SUIT_COLOR  = {"c": "#111111", "s": "#111111", "d": "#c1121f", "h": "#c1121f"}
@@ -754,17 +1085,17 @@ class PokerGameUI(tk.Tk):
         ]
         return c.create_polygon(points, smooth=True, splinesteps=20, **kwargs)
 
-    def draw_card_front(self, x1, y1, w, h, code: str):
+    def draw_card_front(self, x1, y1, w, h, code: str, tags=()):
         """Draw a nicer playing card face (UI only)."""
         c = self.canvas
         rank, suit = self.parse_card(code)
 
         # Card base
-        self.rounded_rect(x1, y1, x1+w, y1+h, r=10, fill="#ffffff", outline="#222222", width=2)
+        self.rounded_rect(x1, y1, x1+w, y1+h, r=10, fill="#ffffff", outline="#222222", width=2, tags=tags)
 
         # Unknown card
         if rank == "?" or suit == "?":
-            c.create_text(x1+w/2, y1+h/2, text="?", fill="#111", font=("Helvetica", int(h*0.35), "bold"))
+            c.create_text(x1+w/2, y1+h/2, text="?", fill="#111", font=("Helvetica", int(h*0.35), "bold"), tags=tags)
             return
 
         sym = self.SUIT_SYMBOL.get(suit, "?")
@@ -772,205 +1103,277 @@ class PokerGameUI(tk.Tk):
 
         # Corner indices
         corner_font = ("Helvetica", max(10, int(h*0.22)), "bold")
-        c.create_text(x1+w*0.18, y1+h*0.16, text=rank, fill=col, font=corner_font)
-        c.create_text(x1+w*0.18, y1+h*0.33, text=sym,  fill=col, font=corner_font)
+        c.create_text(x1+w*0.18, y1+h*0.16, text=rank, fill=col, font=corner_font, tags=tags)
+        c.create_text(x1+w*0.18, y1+h*0.33, text=sym,  fill=col, font=corner_font, tags=tags)
 
-        c.create_text(x1+w*0.82, y1+h*0.84, text=rank, fill=col, font=corner_font)
-        c.create_text(x1+w*0.82, y1+h*0.67, text=sym,  fill=col, font=corner_font)
+        c.create_text(x1+w*0.82, y1+h*0.84, text=rank, fill=col, font=corner_font, tags=tags)
+        c.create_text(x1+w*0.82, y1+h*0.67, text=sym,  fill=col, font=corner_font, tags=tags)
 
         # Center pip
         center_font = ("Helvetica", max(14, int(h*0.45)), "bold")
-        c.create_text(x1+w/2, y1+h/2, text=sym, fill=col, font=center_font)
-
-    def draw_card_back(self, x1, y1, w, h):
-        """Draw a Bicycle-ish patterned back (UI only, no images), without spillover."""
-        c = self.canvas
-
-        # Outer card
-        self.rounded_rect(x1, y1, x1+w, y1+h, r=10, fill="#0b2a6f", outline="#111111", width=2)
-
-        # Inner border
-        pad = max(3, int(min(w, h) * 0.08))
-        ix1, iy1 = x1 + pad, y1 + pad
-        ix2, iy2 = x1 + w - pad, y1 + h - pad
-        self.rounded_rect(ix1, iy1, ix2, iy2, r=8, fill="#0b2a6f", outline="#ffffff", width=2)
-
-        # --- Pattern: tiny diagonal stitches (stays inside the inner rectangle) ---
-        step = max(6, int(min(w, h) * 0.12))
-        seg = max(6, step)  # segment length
-
-        y = iy1 + 2
-        while y < iy2 - 2:
-            x = ix1 + 2
-            while x < ix2 - 2:
-                # down-right stitch
-                x_end = min(x + seg, ix2 - 2)
-                y_end = min(y + seg, iy2 - 2)
-                c.create_line(x, y, x_end, y_end, fill="#ffffff", width=1, stipple="gray50")
-
-                # down-left stitch (adds the crosshatch look)
-                x2s = min(x + seg, ix2 - 2)
-                y2s = max(y - seg, iy1 + 2)
-                c.create_line(x, y, x2s, y2s, fill="#ffffff", width=1, stipple="gray50")
-
-                x += step
-            y += step
-
-        # Center emblem
-        c.create_oval(x1+w*0.35, y1+h*0.35, x1+w*0.65, y1+h*0.65, outline="#ffffff", width=2)
-        c.create_text(x1+w/2, y1+h/2, text="★", fill="#ffffff",
-                    font=("Helvetica", max(12, int(h*0.25)), "bold"))
-
-    def best_hand_type_name(self, hole: tuple[str, str], board: list[str]) -> str:
-        cards7 = list(hole) + list(board)
-        if len(cards7) < 5 or "??" in cards7:
+        c.create_text(x1+w/2, y1+h/2, text=sym, fill=col, font=center_font, tags=tags)
+
+    def draw_card_back(self, x1, y1, w, h, tags=()):
+        """Draw a Bicycle-ish patterned back (UI only), as one pre-rendered image."""
+        size = (int(w), int(h))
+        img = self._card_backs.get(size)
+        if img is None:
+            img = self._card_backs[size] = card_back_image(self, *size)
+        self.canvas.create_image(x1, y1, image=img, anchor="nw", tags=tags)
+
+    def hand_type_name(self, strength: int | None) -> str:
+        if strength is None:
             return "—"
-
-        parsed7 = parse_cards(cards7)
-
-        best = None
-        for combo in combinations(parsed7, 5):
-            sc = score_five(list(combo))
-            if sc is None:
-                continue
-            if best is None or sc > best:
-                best = sc
-
-        if best is None:
-            return "—"
-        return HAND_TYPE_NAME.get(best[0], "—")
+        return HAND_TYPE_NAME.get(STRENGTH_HAND_TYPE[strength], "—")
 
     def player_hand_label(self, seat_index: int) -> str:
         hand = self.game.hand
         if hand is None:
             return "Hand: —"
 
-        p = self.players[seat_index]
+        p = self.game.players[seat_index]
 
         # Don't leak opponents' hands while hidden (unless showdown)
         if p.cards_hidden and not hand.in_showdown and seat_index != 0:
             return "Hand: (hidden)"
 
-        return "Hand: " + self.best_hand_type_name(p.cards, hand.board)
+        return "Hand: " + self.hand_type_name(hand.best_score_for_player(seat_index))
+
 
+    def build_scene(self):
+        """
+        This function creates every canvas item the table needs, once.
+        redraw() then only moves and reconfigures these items instead of deleting and recreating them
+        INPUTS:
+            - none
+        OUTPUTS:
+            - none
+        """
+        c = self.canvas
+
+        # Paint the card back sprites now, so the first deal doesn't stall on it. They're kept per UI
+        # (not in a module cache) because a PhotoImage only lives as long as the Tk that created it
+        self._card_backs = {(w, h): card_back_image(self, w, h) for w, h in (COMMUNITY_CARD_SIZE, HOLE_CARD_SIZE)}
+
+        # Table (oval + inner felt), positioned by layout_table() whenever the canvas size changes
+        self._table_size = None
+        self._id_table_rim = c.create_oval(0, 0, 0, 0, fill="#2a2a2a", outline="", tags=("table",))
+        self._id_table_felt = c.create_oval(0, 0, 0, 0, fill="#1e7a4a", outline="", tags=("table",))
+
+        # Pot
+        self._id_pot = c.create_text(0, 0, text="", fill="white", font=FONT_POT, tags=("pot",))
+
+        # Items are tagged by kind ("stack", "badge", ...) and by seat ("seat3"), and items that
+        # are shown/hidden together share a tag ("seat3hand") so it's one itemconfigure call.
+        # Cards are drawn as a group of items under one tag, and the group is only rebuilt when
+        # the card changes. The anchor is an empty item that keeps the group at the right depth
+        self._card_anchor = {}
+        self._card_drawn = {}  # tag -> (what was drawn, x1, y1)
+        self._shown = {}  # (item, option) -> value last given to configure_item()
+        for i in range(5):
+            self._card_anchor[f"community{i}"] = c.create_text(0, 0, text="")
+
+        self._seat_items = []
+        for i in range(self.n_seats):
+            seat = f"seat{i}"
+            hand, badge = f"seat{i}hand", f"seat{i}badge"
+            items = {
+                "box": c.create_rectangle(0, 0, 0, 0, fill="#2b2b2b", outline="#444", width=2, tags=(seat, "seat_box")),
+                "name": c.create_text(0, 0, text="", fill="white", font=FONT_NAME, tags=(seat, "name")),
+                "stack": c.create_text(0, 0, text="", fill="#cfcfcf", font=FONT_STACK, tags=(seat, "stack")),
+                "hand_box": c.create_rectangle(0, 0, 0, 0, fill="#242424", outline="#444", width=2, state="hidden", tags=(seat, hand, "hand")),
+                "hand_text": c.create_text(0, 0, text="", fill="#e6e6e6", font=FONT_HAND, state="hidden", tags=(seat, hand, "hand")),
+                "badge": c.create_oval(0, 0, 0, 0, width=2, state="hidden", tags=(seat, badge, "badge")),
+                "badge_text": c.create_text(0, 0, text="", fill="black", state="hidden", tags=(seat, badge, "badge")),
+            }
+            self._seat_items.append(items)
+            for k in range(2):
+                self._card_anchor[f"seat{i}card{k}"] = c.create_text(0, 0, text="")
+
+    def update_card(self, tag: str, x1, y1, w, h, code: str | None):
+        """
+        This function keeps one card group on the canvas in sync with what should be shown
+        INPUTS:
+            - tag is the card slot's tag (such as "community0" or "seat3card1")
+            - x1, y1, w, h are the card's bounds
+            - code is None to show nothing, "back" to show the card back, otherwise the card (such as "Ah")
+        OUTPUTS:
+            - none
+        """
+        c = self.canvas
+        last = self._card_drawn.get(tag)
+
+        if last is not None and last[0] == code:
+            # Same card, only move it if the layout changed
+            if code is not None and (last[1], last[2]) != (x1, y1):
+                c.move(tag, x1 - last[1], y1 - last[2])
+        else:
+            c.delete(tag)
+            if code == "back":
+                self.draw_card_back(x1, y1, w, h, tags=(tag, "card"))
+            elif code is not None:
+                self.draw_card_front(x1, y1, w, h, code, tags=(tag, "card"))
+            if code is not None:
+                c.tag_raise(tag, self._card_anchor[tag])
+
+        self._card_drawn[tag] = (code, x1, y1)
 
     def redraw(self):
+        """
+        This function brings every item on the table up to date with the current state
+        INPUTS:
+            - none
+        OUTPUTS:
+            - none
+        """
         c = self.canvas
-        c.delete("all")
 
         w = c.winfo_width()
         h = c.winfo_height()
 
+        # The table only changes shape when the window is resized, not on deals or bets
+        if (w, h) != self._table_size:
+            self._table_size = (w, h)
+            self.layout_table(w, h)
+
+        self.update_pot()
+        self.update_community()
+        for i in range(self.n_seats):
+            self.update_seat(i)
+
+    def layout_table(self, w: int, h: int):
+        """
+        This function moves every item to its place on a w x h canvas.
+        It's the only place items are positioned, the update_* functions only change what items show
+        INPUTS:
+            - w, h are the canvas width and height
+        OUTPUTS:
+            - none
+        """
+        c = self.canvas
+        coords = c.coords  # bound once, it's called for every item of every seat
+
         # Table center and radii (responsive)
         cx, cy = w * 0.5, h * 0.48
         table_rx, table_ry = w * 0.32, h * 0.22
 
-        # Draw table (oval + inner felt)
-        c.create_oval(cx-table_rx*1.15, cy-table_ry*1.15, cx+table_rx*1.15, cy+table_ry*1.15,
-                    fill="#2a2a2a", outline="")
-        c.create_oval(cx-table_rx, cy-table_ry, cx+table_rx, cy+table_ry,
-                    fill="#1e7a4a", outline="")
+        # Table (oval + inner felt)
+        c.coords(self._id_table_rim, cx-table_rx*1.15, cy-table_ry*1.15, cx+table_rx*1.15, cy+table_ry*1.15)
+        c.coords(self._id_table_felt, cx-table_rx, cy-table_ry, cx+table_rx, cy+table_ry)
 
         # Pot
-        c.create_text(cx, cy - table_ry*0.65, text=f"Pot: {self.pot}",
-                    fill="white", font=("Helvetica", 18, "bold"))
+        c.coords(self._id_pot, cx, cy - table_ry*0.65)
 
-        # Community cards (UPDATED: nicer faces/backs)
-        card_w, card_h, gap = 60, 84, 12
+        # Community cards, as (x1, y1, w, h)
+        (card_w, card_h), gap = COMMUNITY_CARD_SIZE, 12
         start_x = cx - (5*card_w + 4*gap)/2
         y_cards = cy - card_h/2
-        for i, card in enumerate(self.community):
-            x1 = start_x + i*(card_w+gap)
-            y1 = y_cards
-            if card == "??":
-                self.draw_card_back(x1, y1, card_w, card_h)
-            else:
-                self.draw_card_front(x1, y1, card_w, card_h, card)
+        self._community_bounds = [(start_x + i*(card_w+gap), y_cards, card_w, card_h) for i in range(5)]
 
         # Seats around table
         seat_rx, seat_ry = w * 0.43, h * 0.32
-        seats = self.seat_positions(cx, cy, seat_rx, seat_ry)
-
-        for i, (sx, sy, ang) in enumerate(seats):
-            p = self.players[i]
-
-            # Seat box
-            box_w, box_h = 150, 60
-            x1, y1 = sx - box_w/2, sy - box_h/2
-            x2, y2 = sx + box_w/2, sy + box_h/2
-
-            seat_color = "#2b2b2b" if p.in_hand else "#1b1b1b"
-            c.create_rectangle(x1, y1, x2, y2, fill=seat_color, outline="#444", width=2)
-
-            c.create_text(sx, sy-10, text=p.name, fill="white", font=("Helvetica", 12, "bold"))
-            c.create_text(sx, sy+12, text=f"Stack: {p.stack}", fill="#cfcfcf", font=("Helvetica", 11))
-
-            # --- Action/bet badge pinned to top-left of seat tag (outside the box) ---
-            badge_r = 14
-            badge_x = x1 + badge_r + 6
-            badge_y = y1 - badge_r - 6
-
-            # ---- Optional HAND box under seat box ----
-            if p.show_hand_box:
-                hand_box_h = 24
-                gap = 6
-                hx1, hy1 = x1, y2 + gap
-                hx2, hy2 = x2, y2 + gap + hand_box_h
-
-                c.create_rectangle(hx1, hy1, hx2, hy2, fill="#242424", outline="#444", width=2)
-                c.create_text(
-                    sx, (hy1 + hy2) / 2,
-                    text=self.player_hand_label(i),
-                    fill="#e6e6e6",
-                    font=("Helvetica", 10, "bold")
-                )
-
-
-            if (p.last_action or "").upper() == "CHECK":
-                # CHECK badge (same style as chip, different color)
-                c.create_oval(
-                    badge_x - badge_r, badge_y - badge_r,
-                    badge_x + badge_r, badge_y + badge_r,
-                    fill="#67c8ff", outline="#1b6a8d", width=2
-                )
-                c.create_text(
-                    badge_x, badge_y,
-                    text="CHK",   # or "CHK" if you want it cleaner
-                    fill="black",
-                    font=("Helvetica", 7, "bold")  # small enough to fit in the circle
-                )
-
-            elif p.bet > 0:
-                # Bet chip (your original)
-                c.create_oval(
-                    badge_x - badge_r, badge_y - badge_r,
-                    badge_x + badge_r, badge_y + badge_r,
-                    fill="#d4af37", outline="#8c6b1f", width=2
-                )
-                c.create_text(
-                    badge_x, badge_y,
-                    text=str(p.bet),
-                    fill="black",
-                    font=("Helvetica", 9, "bold")
-                )
-
-
-
-
-            # Hold cards near seat (UPDATED: nicer faces/backs)
-            if p.in_hand:
-                hold_w, hold_h = 46, 64
-                cards_x, cards_y = sx, sy - 62
-                for k in range(2):
-                    offset = (k - 0.5) * (hold_w * 0.55)
-                    hx1 = (cards_x + offset) - hold_w/2
-                    hy1 = cards_y - hold_h/2
-
-                    if p.cards_hidden:
-                        self.draw_card_back(hx1, hy1, hold_w, hold_h)
-                    else:
-                        self.draw_card_front(hx1, hy1, hold_w, hold_h, p.cards[k])
+        self._hole_bounds = []
+        for items, (item_coords, hole_bounds) in zip(self._seat_items, seat_layout(cx, cy, seat_rx, seat_ry, self.n_seats)):
+            for name, xy in item_coords:
+                coords(items[name], *xy)
+            self._hole_bounds.append(hole_bounds)
+
+    def configure_item(self, item, **options):
+        """
+        This function is canvas.itemconfigure() but skips options the item already has,
+        so redraws where nothing changed make no Tk calls
+        INPUTS:
+            - item is a canvas item id or tag (a tag must always be configured through the tag)
+            - options are the itemconfigure options
+        OUTPUTS:
+            - none
+        """
+        shown = self._shown
+        changed = {k: v for k, v in options.items() if shown.get((item, k)) != v}
+        if changed:
+            for k, v in changed.items():
+                shown[(item, k)] = v
+            self.canvas.itemconfigure(item, **changed)
+
+    def update_pot(self):
+        """
+        This function updates only the pot text
+        INPUTS:
+            - none
+        OUTPUTS:
+            - none
+        """
+        self.configure_item(self._id_pot, text=f"Pot: {self.pot}")
+
+    def update_community(self):
+        """
+        This function updates only the community cards
+        INPUTS:
+            - none
+        OUTPUTS:
+            - none
+        """
+        # Community cards (UPDATED: nicer faces/backs), face down until dealt
+        n_dealt = len(self.community)
+        for i, bounds in enumerate(self._community_bounds):
+            self.update_card(f"community{i}", *bounds, self.community[i] if i < n_dealt else "back")
+
+    def update_seat(self, i: int):
+        """
+        This function updates only the items of one seat
+        INPUTS:
+            - i is the seat index
+        OUTPUTS:
+            - none
+        """
+        p = self.game.players[i]
+        items = self._seat_items[i]
+        configure = self.configure_item  # bound once, it's called for every item of the seat
+
+        seat_color = "#2b2b2b" if p.in_hand else "#1b1b1b"
+        configure(items["box"], fill=seat_color)
+        configure(items["name"], text=p.name)
+        configure(items["stack"], text=f"Stack: {p.stack}")
+
+        # ---- Optional HAND box under seat box ----
+        if p.show_hand_box:
+            configure(items["hand_text"], text=self.player_hand_label(i))
+            configure(f"seat{i}hand", state="normal")
+        else:
+            configure(f"seat{i}hand", state="hidden")
+
+        if (p.last_action or "").upper() == "CHECK":
+            # CHECK badge (same style as chip, different color)
+            configure(items["badge"], fill="#67c8ff", outline="#1b6a8d")
+            configure(
+                items["badge_text"],
+                text="CHK",   # or "CHK" if you want it cleaner
+                font=FONT_CHECK  # small enough to fit in the circle
+            )
+            configure(f"seat{i}badge", state="normal")
+
+        elif p.bet > 0:
+            # Bet chip (your original)
+            configure(items["badge"], fill="#d4af37", outline="#8c6b1f")
+            configure(
+                items["badge_text"],
+                text=str(p.bet),
+                font=FONT_CHIP
+            )
+            configure(f"seat{i}badge", state="normal")
 
+        else:
+            configure(f"seat{i}badge", state="hidden")
+
+        # Hold cards near seat (UPDATED: nicer faces/backs)
+        for k in range(2):
+            if not p.in_hand:
+                code = None
+            elif p.cards_hidden:
+                code = "back"
+            else:
+                code = PACKED_STR[p.cards[k]]
+            self.update_card(f"seat{i}card{k}", *self._hole_bounds[i][k], code)
 
     # -=x=- Button Functionality -=x=-
     def toggle_game(self):
@@ -1021,14 +1424,8 @@ class PokerGameUI(tk.Tk):
         self.game = PokerGame(n_seats=self.n_seats, big_blind_amount=self.game.big_blind_amount)
 
         # reset UI state to initial
-        self.players = [UIPlayer(name="Me (Seat 1)", stack=1500, bet=0, in_hand=True, cards_hidden=False)]
-        self.players += [
-            UIPlayer(name=f"Seat {i+1}", stack=1500, bet=0, in_hand=True, cards_hidden=True)
-            for i in range(1, self.n_seats)
-        ]
-
         self.pot = 0
-        self.community = ["??"] * 5
+        self.community = []
 
         self.game_running = False
         self.paused = False
@@ -1058,14 +1455,5 @@ class PokerGameUI(tk.Tk):
         self.paused = False
         self.start_pause_btn.config(text="Pause Game")
 
-print(score_five(parse_cards(["Ah", "Kh", "Qh", "Jh", "Th"])))
-print(score_five(parse_cards(["Th", "9h", "8h", "7h", "6h"])))
-print(score_five(parse_cards(["Th", "Ts", "Tc", "Td", "9s"])))
-print(score_five(parse_cards(["Th", "Ts", "Tc", "9h", "9s"])))
-print(score_five(parse_cards(["Th", "3h", "5h", "8h", "7h"])))
-print(score_five(parse_cards(["Th", "9s", "8c", "7h", "6s"])))
-print(score_five(parse_cards(["Th", "Ts", "Tc", "9h", "8s"])))
-print(score_five(parse_cards(["Th", "Ts", "5c", "9h", "9s"])))
-print(score_five(parse_cards(["Th", "Ts", "6c", "9h", "4s"])))
-print(score_five(parse_cards(["Th", "8s", "6c", "4h", "2s"])))
-PokerGameUI(n_seats=8).mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    PokerGameUI(n_seats=8).mainloop()
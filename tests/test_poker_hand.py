@@ -0,0 +1,30 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import PokerGame
+
+
+def test_full_table_deals_distinct_cards():
+    game = PokerGame(n_seats=8, big_blind_amount=50)
+    game.start_hand()
+    hand = game.hand
+    hand.deal_flop()
+    hand.deal_turn()
+    hand.deal_river()
+    cards = [c for p in game.players for c in p.cards] + hand.board
+    assert len(set(cards)) == len(cards) == 21
+
+
+def test_running_out_of_cards_raises():
+    # 24 seats need 48 hole cards + 5 board cards, one more than the deck has
+    game = PokerGame(n_seats=24, big_blind_amount=50)
+    game.start_hand()
+    hand = game.hand
+    hand.deal_flop()
+    hand.deal_turn()
+    with pytest.raises(IndexError):
+        hand.deal_river()
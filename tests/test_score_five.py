@@ -0,0 +1,73 @@
+import os
+import random
+import sys
+from itertools import combinations_with_replacement
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import CARD_INT, CARD_STRS, RANKS, SUITS, evaluate_five, parse_cards, score_five
+
+
+@pytest.mark.parametrize("cards, expected", [
+    (["Ah", "Kh", "Qh", "Jh", "Th"], (9, ())),
+    (["Th", "9h", "8h", "7h", "6h"], (8, (10,))),
+    (["Th", "Ts", "Tc", "Td", "9s"], (7, (10, 9))),
+    (["Th", "Ts", "Tc", "9h", "9s"], (6, (10, 9))),
+    (["3h", "3s", "3c", "2h", "2s"], (6, (3, 2))),  # full house, trips first
+    (["2h", "2s", "2c", "3h", "3s"], (6, (2, 3))),
+    (["Th", "3h", "5h", "8h", "7h"], (5, (10, 8, 7, 5, 3))),
+    (["Th", "9s", "8c", "7h", "6s"], (4, (10,))),
+    (["Th", "Ts", "Tc", "9h", "8s"], (3, (10, 9, 8))),
+    (["Th", "Ts", "5c", "9h", "9s"], (2, (10, 9, 5))),
+    (["Th", "Ts", "2c", "9h", "9s"], (2, (10, 9, 2))),  # two pair, the 2 is the kicker
+    (["Th", "Ts", "6c", "9h", "4s"], (1, (10, 9, 6, 4))),
+    (["Th", "8s", "6c", "4h", "2s"], (0, (10, 8, 6, 4, 2))),
+])
+def test_score_five(cards, expected):
+    assert score_five(parse_cards(cards)) == expected
+
+
+
+def test_full_house_ranked_by_trips_first():
+    threes_full = ["3h", "3s", "3c", "2h", "2s"]
+    twos_full = ["2h", "2s", "2c", "3h", "3s"]
+    assert score_five(parse_cards(twos_full)) < score_five(parse_cards(threes_full))
+    assert evaluate_five(*(CARD_INT[c] for c in twos_full)) < evaluate_five(*(CARD_INT[c] for c in threes_full))
+
+def class_representatives():
+    """One five-card hand (as card strings) for every distinct hand class"""
+    hands = []
+    for ranks in combinations_with_replacement(RANKS, 5):
+        if max(ranks.count(r) for r in ranks) > 4:
+            continue
+        if len(set(ranks)) == 5:
+            hands.append([r + "s" for r in ranks])  # flush / straight flush
+            hands.append([ranks[0] + "h"] + [r + "s" for r in ranks[1:]])
+        else:
+            # Repeated ranks get different suits
+            hands.append([r + SUITS[ranks[:k].count(r)] for k, r in enumerate(ranks)])
+    return hands
+
+
+def assert_same_order(hands):
+    """evaluate_five must rank the hands exactly like score_five, ties included"""
+    scored = sorted((score_five(parse_cards(h)), evaluate_five(*(CARD_INT[c] for c in h))) for h in hands)
+    for (score_a, strength_a), (score_b, strength_b) in zip(scored, scored[1:]):
+        if score_a == score_b:
+            assert strength_a == strength_b
+        else:
+            assert strength_a < strength_b
+
+
+def test_evaluate_five_matches_score_five_on_every_class():
+    hands = class_representatives()
+    assert len(hands) == 7462
+    assert_same_order(hands)
+    assert len({evaluate_five(*(CARD_INT[c] for c in h)) for h in hands}) == 7462
+
+
+def test_evaluate_five_matches_score_five_on_random_hands():
+    rng = random.Random(1234)
+    assert_same_order([rng.sample(CARD_STRS, 5) for _ in range(20000)])